@@ -60,17 +60,11 @@ class SingleModelSQLiteDatabase:
 
   def QueryRecordsAsJson(self, query_condition: str=None):
     raw_records = self._op.SelectFieldFromTable("*", self.table_name, query_condition)
-    results = []
-    for record in raw_records:
-      results.append(record)
-    return results
+    return list(raw_records)
   
   def RawQueryRecords(self, query_key="*", query_condition: str=None):
     raw_records = self._op.RawSelectFieldFromTable(query_key, self.table_name, query_condition)
-    results = []
-    for record in raw_records:
-      results.append(record)
-    return results
+    return list(raw_records)
   
   def RawSelectFieldFromTableWithReturnFieldName(self, fields, sub_condition: str=None):
     """ fast interface """
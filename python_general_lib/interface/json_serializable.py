@@ -46,7 +46,7 @@ class IJsonSerializableWithDefault:
 
 def AutoObjectToJsonHandler(obj):
   obj_class = type(obj)
-  all_class_props = dir(obj_class)
+  all_class_props = set(dir(obj_class))
 
   all_sub_props = dir(obj)
   name_value_dict = {}
@@ -70,9 +70,14 @@ def AutoObjectToJsonHandler(obj):
   return name_value_dict
 
 def AutoObjectFromJsonHander(obj, j, allow_not_defined_attr=False):
-  all_sub_props = dir(obj)
+  if allow_not_defined_attr:
+    # no attribute check needed, skip building dir(obj) for every loaded record
+    for key, value in j.items():
+      setattr(obj, key, value)
+    return
+  all_sub_props = set(dir(obj))
   for key, value in j.items():
-    if not allow_not_defined_attr and not key in all_sub_props:
+    if not key in all_sub_props:
       # raise ValueError("cannot auto load json fields")
       continue
     setattr(obj, key, value)
\ No newline at end of file